@@ -17,9 +17,19 @@ class Settings(BaseSettings):
     pytorch_model_path: str = "kokoro-v0_19.pth"
     onnx_model_path: str = "kokoro-v0_19.onnx"
     voices_dir: str = "voices"
+    n_cache_voices: int = 3  # Number of voices kept in the in-memory voice cache
     sample_rate: int = 24000
     max_chunk_size: int = 300  # Maximum size of text chunks for processing
+    target_chunk_tokens: int = 128  # Token budget chunks are packed towards
+    max_batch_size: int = 8  # Maximum number of chunks generated per batched forward pass
     gap_trim_ms: int = 250  # Amount to trim from streaming chunk ends in milliseconds
+    use_cuda_graphs: bool = False  # Capture the text encoder as CUDA graphs per padded shape
+    use_torch_compile: bool = False  # Compile the GPU decoder with torch.compile at warmup
+    cleanup_every_n: int = 256  # Release cached GPU memory every N generations
+    debug_gpu_memory: bool = False  # Log GPU memory usage on every generation
+    cuda_alloc_conf: str = (  # PYTORCH_CUDA_ALLOC_CONF default, empty to leave unset
+        "expandable_segments:True,max_split_size_mb:128,garbage_collection_threshold:0.8"
+    )
 
     # ONNX Optimization Settings
     onnx_num_threads: int = 4  # Number of threads for intra-op parallelism
@@ -2,6 +2,7 @@
 FastAPI OpenAI Compatible API
 """
 
+import os
 import sys
 from contextlib import asynccontextmanager
 
@@ -44,8 +45,15 @@ async def lifespan(app: FastAPI):
     """Lifespan context manager for model initialization"""
     logger.info("Loading TTS model and voice packs...")
 
+    # The CUDA caching allocator reads its config on the first CUDA allocation,
+    # so it must be set before the model is set up. An explicit environment
+    # variable takes precedence.
+    if settings.cuda_alloc_conf:
+        os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", settings.cuda_alloc_conf)
+
     # Initialize the main model with warm-up
     voicepack_count = await TTSModel.setup()
+    TTSService.refresh_voices()
     # boundary = "█████╗"*9
     boundary = "░" * 2*12
     startup_msg = f"""
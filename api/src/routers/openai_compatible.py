@@ -120,7 +120,12 @@ async def create_speech(
 
             # Convert to requested format
             content = AudioService.convert_audio(
-                audio, 24000, request.response_format, is_first_chunk=True, stream=False
+                audio,
+                24000,
+                request.response_format,
+                is_first_chunk=True,
+                stream=False,
+                input_is_int16=True,
             )
 
             return Response(
@@ -155,6 +160,17 @@ async def list_voices(tts_service: TTSService = Depends(get_tts_service)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/audio/voices/refresh")
+async def refresh_voices(tts_service: TTSService = Depends(get_tts_service)):
+    """Rebuild the voice index after voice files changed on disk"""
+    try:
+        voices = tts_service.refresh_voices()
+        return {"voices": voices}
+    except Exception as e:
+        logger.error(f"Error refreshing voices: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/audio/voices/combine")
 async def combine_voices(
     request: Union[str, List[str]], tts_service: TTSService = Depends(get_tts_service)
@@ -3,7 +3,6 @@
 from io import BytesIO
 
 import numpy as np
-import scipy.io.wavfile as wavfile
 import soundfile as sf
 from loguru import logger
 
@@ -19,22 +18,38 @@ class AudioNormalizer:
         self.sample_rate = 24000  # Sample rate of the audio
         self.samples_to_trim = int(self.chunk_trim_ms * self.sample_rate / 1000)
 
+    @staticmethod
+    def to_int16(audio_data: np.ndarray) -> np.ndarray:
+        """Scale float audio in [-1, 1] to clipped int16 samples
+
+        The input is never modified: scaling writes to a new float32 array,
+        which is then clipped in place and cast, so callers can keep using
+        the float audio they passed in.
+        """
+        scaled = np.multiply(audio_data, 32767, dtype=np.float32)
+        np.clip(scaled, -32768, 32767, out=scaled)
+        return scaled.astype(np.int16, copy=False)
+
     def normalize(
-        self, audio_data: np.ndarray, is_last_chunk: bool = False
+        self,
+        audio_data: np.ndarray,
+        is_last_chunk: bool = False,
+        input_is_int16: bool = False,
     ) -> np.ndarray:
         """Convert audio data to int16 range and trim chunk boundaries"""
         if len(audio_data) == 0:
             raise ValueError("Audio data cannot be empty")
-            
-        # Simple float32 to int16 conversion
-        audio_float = audio_data.astype(np.float32)
-        
+
         # Trim for non-final chunks
-        if not is_last_chunk and len(audio_float) > self.samples_to_trim:
-            audio_float = audio_float[:-self.samples_to_trim]
-        
+        if not is_last_chunk and len(audio_data) > self.samples_to_trim:
+            audio_data = audio_data[:-self.samples_to_trim]
+
+        # Already scaled, e.g. by the generation pipeline
+        if input_is_int16:
+            return audio_data.astype(np.int16, copy=False)
+
         # Direct scaling like the non-streaming version
-        return (audio_float * 32767).astype(np.int16)
+        return (audio_data.astype(np.float32) * 32767).astype(np.int16)
 
 
 class AudioService:
@@ -64,6 +79,7 @@ class AudioService:
         normalizer: AudioNormalizer = None,
         format_settings: dict = None,
         stream: bool = True,
+        input_is_int16: bool = False,
     ) -> bytes:
         """Convert audio data to specified format
 
@@ -85,6 +101,7 @@ class AudioService:
                 - MP3: constant bitrate, no compression (0.0)
                 - OPUS: no compression (0.0)
                 - FLAC: no compression (0.0)
+            input_is_int16: Whether audio_data is already int16 samples, skipping scaling
 
         Returns:
             Bytes of the converted audio
@@ -96,7 +113,7 @@ class AudioService:
             if normalizer is None:
                 normalizer = AudioNormalizer()
             normalized_audio = normalizer.normalize(
-                audio_data, is_last_chunk=is_last_chunk
+                audio_data, is_last_chunk=is_last_chunk, input_is_int16=input_is_int16
             )
 
             if output_format == "pcm":
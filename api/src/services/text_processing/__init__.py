@@ -1,10 +1,11 @@
 from .normalizer import normalize_text
-from .phonemizer import EspeakBackend, PhonemizerBackend, phonemize
+from .phonemizer import EspeakBackend, PhonemizerBackend, phonemize, phonemize_batch
 from .vocabulary import VOCAB, decode_tokens, tokenize
 
 __all__ = [
     "normalize_text",
     "phonemize",
+    "phonemize_batch",
     "tokenize",
     "decode_tokens",
     "VOCAB",
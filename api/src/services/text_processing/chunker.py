@@ -1,8 +1,17 @@
 """Text chunking service"""
 
 import re
+from itertools import islice
+
+from loguru import logger
 
 from ...core.config import settings
+from .phonemizer import phonemize, phonemize_batch
+from .vocabulary import VOCAB, tokenize
+
+# Padded token lengths that chunks are packed towards, shared with the
+# CUDA graph buckets so packed chunks reuse the same captured shapes
+TOKEN_BUCKETS = (32, 64, 128, 256, 512)
 
 
 def split_text(text: str, max_chunk=None):
@@ -51,3 +60,83 @@ def split_text(text: str, max_chunk=None):
                     yield part
         else:
             yield sentence
+
+
+def _tokenize_sentences(sentences, language):
+    """Phonemize and tokenize sentences, one at a time if the batch fails"""
+    try:
+        phonemes_list = phonemize_batch(sentences, language)
+        if len(phonemes_list) == len(sentences):
+            return [tokenize(ps) for ps in phonemes_list]
+        logger.warning(
+            f"Batched phonemization returned {len(phonemes_list)} results "
+            f"for {len(sentences)} sentences, falling back"
+        )
+    except Exception as e:
+        logger.warning(f"Batched phonemization failed, falling back: {str(e)}")
+
+    results = []
+    for sentence in sentences:
+        try:
+            results.append(tokenize(phonemize(sentence, language)))
+        except Exception as e:
+            logger.error(f"Failed to process chunk: '{sentence}'. Error: {str(e)}")
+            results.append(None)
+    return results
+
+
+def split_text_tokens(
+    text: str,
+    language: str = "a",
+    target_tokens=None,
+    pad_to=TOKEN_BUCKETS,
+    group_size=8,
+    pack_first=True,
+):
+    """Split text into chunks packed up to a token budget
+
+    Sentences from split_text are phonemized group_size at a time and packed
+    greedily until the next one would overflow the smallest bucket in pad_to
+    that holds target_tokens, less the start/end tokens the model adds.
+
+    Args:
+        text: Text to split into chunks
+        language: Language code for phonemization
+        target_tokens: Token budget per chunk (defaults to settings.target_chunk_tokens)
+        pad_to: Padded token lengths to round the budget up to
+        group_size: Number of sentences phonemized per call
+        pack_first: If False, the first sentence is phonemized alone and
+            yielded unpacked, for low time to first audio when streaming
+
+    Yields:
+        tuple[str, list[int]]: Chunk text and token IDs, without start/end tokens
+    """
+    if target_tokens is None:
+        target_tokens = settings.target_chunk_tokens
+    buckets = sorted(pad_to)
+    limit = next((b for b in buckets if b >= target_tokens), buckets[-1]) - 2
+    space = VOCAB[" "]
+
+    sentences = split_text(text)
+    texts, tokens = [], []
+    emit_next = not pack_first
+    while group := list(islice(sentences, 1 if emit_next else group_size)):
+        for sentence, sentence_tokens in zip(
+            group, _tokenize_sentences(group, language)
+        ):
+            if not sentence_tokens:
+                continue
+            if texts and len(tokens) + 1 + len(sentence_tokens) > limit:
+                yield " ".join(texts), tokens
+                texts, tokens = [], []
+            if texts:
+                tokens.append(space)
+            texts.append(sentence)
+            tokens.extend(sentence_tokens)
+            if emit_next:
+                yield " ".join(texts), tokens
+                texts, tokens = [], []
+                emit_next = False
+
+    if texts:
+        yield " ".join(texts), tokens
@@ -1,5 +1,6 @@
 import re
 from abc import ABC, abstractmethod
+from typing import List
 
 import phonemizer
 
@@ -21,6 +22,17 @@ class PhonemizerBackend(ABC):
         """
         pass
 
+    def phonemize_batch(self, texts: List[str]) -> List[str]:
+        """Convert several texts to phonemes
+
+        Args:
+            texts: Texts to convert to phonemes
+
+        Returns:
+            Phonemized texts, in input order
+        """
+        return [self.phonemize(text) for text in texts]
+
 
 class EspeakBackend(PhonemizerBackend):
     """Espeak-based phonemizer implementation"""
@@ -48,7 +60,21 @@ class EspeakBackend(PhonemizerBackend):
         # Phonemize text
         ps = self.backend.phonemize([text])
         ps = ps[0] if ps else ""
+        return self._postprocess(ps)
+
+    def phonemize_batch(self, texts: List[str]) -> List[str]:
+        """Convert several texts to phonemes with a single espeak call
+
+        Args:
+            texts: Texts to convert to phonemes
+
+        Returns:
+            Phonemized texts, in input order
+        """
+        return [self._postprocess(ps) for ps in self.backend.phonemize(texts)]
 
+    def _postprocess(self, ps: str) -> str:
+        """Apply Kokoro-specific fixes to raw espeak output"""
         # Handle special cases
         ps = ps.replace("kəkˈoːɹoʊ", "kˈoʊkəɹoʊ").replace("kəkˈɔːɹəʊ", "kˈəʊkəɹəʊ")
         ps = ps.replace("ʲ", "j").replace("r", "ɹ").replace("x", "k").replace("ɬ", "l")
@@ -96,3 +122,23 @@ def phonemize(text: str, language: str = "a", normalize: bool = True) -> str:
 
     phonemizer = create_phonemizer(language)
     return phonemizer.phonemize(text)
+
+
+def phonemize_batch(
+    texts: List[str], language: str = "a", normalize: bool = True
+) -> List[str]:
+    """Convert several texts to phonemes, sharing one phonemizer backend
+
+    Args:
+        texts: Texts to convert to phonemes
+        language: Language code ('a' for US English, 'b' for British English)
+        normalize: Whether to normalize texts before phonemization
+
+    Returns:
+        Phonemized texts, in input order
+    """
+    if normalize:
+        texts = [normalize_text(text) for text in texts]
+
+    phonemizer = create_phonemizer(language)
+    return phonemizer.phonemize_batch(texts)
@@ -132,6 +132,30 @@ class TTSBaseModel(ABC):
         """
         pass
 
+    @classmethod
+    def prepare_tokens(cls, tokens: List[int]) -> List[int]:
+        """Convert raw token IDs into the form generate_from_tokens expects
+
+        Args:
+            tokens: Token IDs without start/end tokens
+
+        Returns:
+            list[int]: Token IDs for this backend
+        """
+        return tokens
+
+    @classmethod
+    def stage_tokens(cls, tokens: List[int]):
+        """Start moving prepared tokens to the model's device ahead of use
+
+        Args:
+            tokens: Token IDs from prepare_tokens
+
+        Returns:
+            Tokens in a form generate_from_tokens accepts
+        """
+        return tokens
+
     @classmethod
     @abstractmethod
     def generate_from_text(
@@ -167,6 +191,44 @@ class TTSBaseModel(ABC):
         """
         pass
 
+    @classmethod
+    def generate_from_tokens_batch(
+        cls,
+        tokens: torch.Tensor,
+        mask: torch.Tensor,
+        voicepack: torch.Tensor,
+        speed: float,
+    ) -> List[np.ndarray]:
+        """Generate audio for a batch of right-padded token sequences
+
+        Backends without batched inference fall back to one call per row.
+
+        Args:
+            tokens: Token IDs of shape (batch, max_len), right-padded
+            mask: Boolean mask of shape (batch, max_len), True for real tokens
+            voicepack: Voice tensor
+            speed: Speed factor
+
+        Returns:
+            list[np.ndarray]: Generated audio samples per row
+        """
+        lengths = mask.sum(dim=-1).tolist()
+        rows = tokens.tolist()
+        return [
+            cls.generate_from_tokens(row[:length], voicepack, speed)
+            for row, length in zip(rows, lengths)
+        ]
+
+    @classmethod
+    def cleanup(cls):
+        """Release cached device memory, if the backend holds any"""
+        pass
+
+    @classmethod
+    def compile_model(cls):
+        """Compile the model for faster inference, if the backend supports it"""
+        pass
+
     @classmethod
     def get_device(cls):
         """Get the current device"""
@@ -108,6 +108,18 @@ class TTSCPUModel(TTSBaseModel):
         tokens = [0] + tokens + [0]  # Add start/end tokens
         return phonemes, tokens
 
+    @classmethod
+    def prepare_tokens(cls, tokens: list[int]) -> list[int]:
+        """Add the start/end tokens the ONNX model expects
+
+        Args:
+            tokens: Token IDs without start/end tokens
+
+        Returns:
+            list[int]: Token IDs with start/end tokens
+        """
+        return [0] + tokens + [0]
+
     @classmethod
     def generate_from_text(
         cls, text: str, voicepack: torch.Tensor, language: str, speed: float
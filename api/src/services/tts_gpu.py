@@ -1,5 +1,8 @@
+import gc
 import os
+import threading
 import time
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import torch
@@ -8,8 +11,12 @@ from loguru import logger
 
 from ..core.config import settings
 from .text_processing import phonemize, tokenize
+from .text_processing.chunker import TOKEN_BUCKETS
 from .tts_base import TTSBaseModel
 
+# Padded token lengths that get their own captured CUDA graph
+CUDA_GRAPH_BUCKETS = TOKEN_BUCKETS
+
 
 # @torch.no_grad()
 # def forward(model, tokens, ref_s, speed):
@@ -36,24 +43,34 @@ from .tts_base import TTSBaseModel
 #     t_en = model.text_encoder(tokens, input_lengths, text_mask)
 #     asr = t_en @ pred_aln_trg.unsqueeze(0).to(device)
 #     return model.decoder(asr, F0_pred, N_pred, ref_s[:, :128]).squeeze().cpu().numpy()
+
+
+def encode_text(model, tokens, text_mask):
+    """Run the PL-BERT text encoder and its projection"""
+    bert_dur = model.bert(tokens, attention_mask=(~text_mask).int())
+    return model.bert_encoder(bert_dur)
+
+
 @torch.no_grad()
-def forward(model, tokens, ref_s, speed):
+def forward(model, tokens, ref_s, speed, encode=encode_text):
     """Forward pass through the model with moderate memory management"""
     device = ref_s.device
     
     try:
-        # Initial tensor setup with proper device placement
-        tokens = torch.LongTensor([[0, *tokens, 0]]).to(device)
+        # Initial tensor setup with proper device placement; staged tokens
+        # already carry the start/end tokens and live on the device
+        if not isinstance(tokens, torch.Tensor):
+            tokens = torch.LongTensor([[0, *tokens, 0]]).to(device)
         input_lengths = torch.LongTensor([tokens.shape[-1]]).to(device)
         text_mask = length_to_mask(input_lengths).to(device)
 
-        # Split and clone reference signals with explicit device placement
-        s_content = ref_s[:, 128:].clone().to(device)
-        s_ref = ref_s[:, :128].clone().to(device)
+        # Split reference signals; these are views into the cached voicepack,
+        # which nothing below modifies in place
+        s_content = ref_s[:, 128:]
+        s_ref = ref_s[:, :128]
 
         # BERT and encoder pass
-        bert_dur = model.bert(tokens, attention_mask=(~text_mask).int())
-        d_en = model.bert_encoder(bert_dur).transpose(-1, -2)
+        d_en = encode(model, tokens, text_mask).transpose(-1, -2)
 
         # Predictor forward pass
         d = model.predictor.text_encoder(d_en, s_content, input_lengths, text_mask)
@@ -98,6 +115,113 @@ def forward(model, tokens, ref_s, speed):
         del pred_aln_trg, asr
 
 
+@torch.no_grad()
+def forward_batch(model, tokens, lengths, ref_s, speed, encode=encode_text):
+    """Forward pass over a batch of right-padded token sequences
+
+    Args:
+        model: Kokoro model
+        tokens: Token IDs of shape (batch, max_len), padded with 0 and
+            without start/end tokens
+        lengths: True token count per row
+        ref_s: Reference styles of shape (batch, 256)
+        speed: Speed factor
+        encode: Text encoder callable, see encode_text
+
+    Returns:
+        list[np.ndarray]: Audio samples per row, matching forward() on that row
+    """
+    device = ref_s.device
+
+    # Add start/end tokens; the pad id is 0 so the first pad doubles as end token
+    tokens = torch.nn.functional.pad(tokens, (1, 1), value=0)
+    input_lengths = lengths + 2
+    text_mask = length_to_mask(input_lengths)
+
+    s_content = ref_s[:, 128:]
+    s_ref = ref_s[:, :128]
+
+    # BERT and encoder pass
+    d_en = encode(model, tokens, text_mask).transpose(-1, -2)
+
+    # Predictor forward pass, packed so padding does not leak into the LSTM
+    d = model.predictor.text_encoder(d_en, s_content, input_lengths, text_mask)
+    x = torch.nn.utils.rnn.pack_padded_sequence(
+        d, input_lengths.cpu(), batch_first=True, enforce_sorted=False
+    )
+    x, _ = model.predictor.lstm(x)
+    x, _ = torch.nn.utils.rnn.pad_packed_sequence(
+        x, batch_first=True, total_length=d.shape[1]
+    )
+
+    # Duration prediction, padded positions get zero frames
+    duration = model.predictor.duration_proj(x)
+    duration = torch.sigmoid(duration).sum(axis=-1) / speed
+    pred_dur = torch.round(duration).clamp(min=1).long().masked_fill(text_mask, 0)
+    del duration, x
+
+    # Alignment matrix construction from cumulative durations
+    frame_ends = torch.cumsum(pred_dur, dim=-1)
+    frame_starts = frame_ends - pred_dur
+    n_frames = frame_ends[:, -1]
+    frames = torch.arange(int(n_frames.max()), device=device)[None, None, :]
+    pred_aln_trg = (
+        (frames >= frame_starts[..., None]) & (frames < frame_ends[..., None])
+    ).float()
+
+    en = d.transpose(-1, -2) @ pred_aln_trg
+    del d
+
+    # Shared prosody LSTM, packed by frame count like the duration LSTM
+    x = torch.nn.utils.rnn.pack_padded_sequence(
+        en.transpose(-1, -2), n_frames.cpu(), batch_first=True, enforce_sorted=False
+    )
+    x, _ = model.predictor.shared(x)
+    x, _ = torch.nn.utils.rnn.pad_packed_sequence(x, batch_first=True)
+    del en
+
+    t_en = model.text_encoder(tokens, input_lengths, text_mask)
+    asr = t_en @ pred_aln_trg
+    del t_en, pred_aln_trg
+
+    # The F0/N blocks and the decoder instance-normalize over time, so padded
+    # frames would shift every shorter row; run them per row, unpadded
+    audio = []
+    for i, n in enumerate(n_frames.tolist()):
+        F0_pred, N_pred = predict_f0n(
+            model.predictor, x[i : i + 1, :n], s_content[i : i + 1]
+        )
+        output = model.decoder(
+            asr[i : i + 1, :, :n], F0_pred, N_pred, s_ref[i : i + 1]
+        )
+        audio.append(output.squeeze().cpu().numpy())
+    return audio
+
+
+def predict_f0n(predictor, x, s):
+    """Run the F0 and N branches of ProsodyPredictor.F0Ntrain
+
+    Args:
+        predictor: ProsodyPredictor
+        x: Output of predictor.shared, of shape (batch, frames, channels)
+        s: Style vector
+
+    Returns:
+        tuple[torch.Tensor, torch.Tensor]: F0 and N curves
+    """
+    F0 = x.transpose(-1, -2)
+    for block in predictor.F0:
+        F0 = block(F0, s)
+    F0 = predictor.F0_proj(F0)
+
+    N = x.transpose(-1, -2)
+    for block in predictor.N:
+        N = block(N, s)
+    N = predictor.N_proj(N)
+
+    return F0.squeeze(1), N.squeeze(1)
+
+
 # def length_to_mask(lengths):
 #     """Create attention mask from lengths"""
 #     mask = (
@@ -127,6 +251,16 @@ def length_to_mask(lengths):
 class TTSGPUModel(TTSBaseModel):
     _instance = None
     _device = "cuda"
+    # (batch_size, padded_len) -> (graph, static tokens, static mask, static output)
+    _graph_cache: Dict[
+        Tuple[int, int],
+        Optional[Tuple[torch.cuda.CUDAGraph, torch.Tensor, torch.Tensor, torch.Tensor]],
+    ] = {}
+    # Guards graph capture and the shared static buffers of each graph, since
+    # inference runs in executor threads
+    _graph_lock = threading.Lock()
+    # Side stream for host-to-device token copies, created on first use
+    _copy_stream: Optional[torch.cuda.Stream] = None
 
     @classmethod
     def get_instance(cls):
@@ -150,6 +284,95 @@ class TTSGPUModel(TTSBaseModel):
                 return None
         return cls._instance
 
+    @classmethod
+    def compile_model(cls):
+        """Compile the decoder with torch.compile
+
+        The decoder is the bulk of the compute and is fully convolutional, so
+        it compiles with dynamic frame counts. The other stages pack padded
+        sequences through host-side lengths and would mostly graph-break.
+        """
+        if cls._instance is None:
+            raise RuntimeError("GPU model not initialized")
+        cls._instance.decoder = torch.compile(cls._instance.decoder, dynamic=True)
+
+    @classmethod
+    def _capture_text_encoder(cls, batch_size: int, length: int):
+        """Capture the text encoder as a CUDA graph for a fixed input shape
+
+        Only the encoder has a static shape; everything after duration
+        prediction depends on the predicted frame count and runs eagerly.
+        Called with _graph_lock held, in inference mode.
+        """
+        model = cls._instance
+        static_tokens = torch.zeros(
+            (batch_size, length), dtype=torch.long, device=cls._device
+        )
+        static_mask = torch.zeros(
+            (batch_size, length), dtype=torch.bool, device=cls._device
+        )
+
+        # Warm up on a side stream before capture, as required by CUDA graphs
+        side_stream = torch.cuda.Stream()
+        side_stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(side_stream):
+            for _ in range(2):
+                encode_text(model, static_tokens, static_mask)
+        torch.cuda.current_stream().wait_stream(side_stream)
+
+        # Thread-local capture, so eager kernels that other executor threads
+        # launch meanwhile do not invalidate it
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph, capture_error_mode="thread_local"):
+            static_out = encode_text(model, static_tokens, static_mask)
+        return graph, static_tokens, static_mask, static_out
+
+    @classmethod
+    def _encode_text(cls, model, tokens: torch.Tensor, text_mask: torch.Tensor):
+        """Run the text encoder, replaying a captured CUDA graph when enabled
+
+        Inputs are right-padded to the next bucket in CUDA_GRAPH_BUCKETS with
+        masked-out pad tokens, so real positions see the same attention.
+        """
+        batch_size, length = tokens.shape
+        bucket = next((b for b in CUDA_GRAPH_BUCKETS if b >= length), None)
+        if (
+            not settings.use_cuda_graphs
+            or not cls.get_device().startswith("cuda")
+            or bucket is None
+        ):
+            return encode_text(model, tokens, text_mask)
+
+        key = (batch_size, bucket)
+        with cls._graph_lock:
+            # The static buffers are inference tensors, so capture and every
+            # in-place update run in inference mode whoever the caller is
+            with torch.inference_mode():
+                if key not in cls._graph_cache:
+                    try:
+                        cls._graph_cache[key] = cls._capture_text_encoder(
+                            batch_size, bucket
+                        )
+                    except Exception as e:
+                        logger.warning(
+                            f"CUDA graph capture failed for shape {key}: {e}"
+                        )
+                        cls._graph_cache[key] = None
+                entry = cls._graph_cache[key]
+                if entry is not None:
+                    # Copy in and replay under the lock, so another thread
+                    # cannot overwrite the static buffers in between
+                    graph, static_tokens, static_mask, static_out = entry
+                    static_tokens.zero_()
+                    static_tokens[:, :length].copy_(tokens)
+                    static_mask.fill_(True)
+                    static_mask[:, :length].copy_(text_mask)
+                    graph.replay()
+            if entry is not None:
+                # Cloned outside inference mode, so callers get a normal tensor
+                return static_out[:, :length].clone()
+        return encode_text(model, tokens, text_mask)
+
     @classmethod
     def process_text(cls, text: str, language: str) -> tuple[str, list[int]]:
         """Process text into phonemes and tokens
@@ -191,14 +414,40 @@ class TTSGPUModel(TTSBaseModel):
 
         return audio, phonemes
 
+    @classmethod
+    def stage_tokens(cls, tokens: list[int]):
+        """Copy tokens to the GPU on a side stream so the copy overlaps compute
+
+        The tokens, with start/end tokens added, are written into pinned host
+        memory and copied asynchronously; generate_from_tokens makes its
+        stream wait for the copy before reading them.
+
+        Args:
+            tokens: Token IDs without start/end tokens
+
+        Returns:
+            torch.Tensor: [1, len(tokens) + 2] token tensor on the GPU, or the
+            tokens unchanged when CUDA is unavailable
+        """
+        if not torch.cuda.is_available():
+            return tokens
+        if cls._copy_stream is None:
+            cls._copy_stream = torch.cuda.Stream(device=cls._device)
+        staging = torch.empty((1, len(tokens) + 2), dtype=torch.long, pin_memory=True)
+        staging[0, 0] = 0
+        staging[0, -1] = 0
+        staging[0, 1:-1] = torch.as_tensor(tokens, dtype=torch.long)
+        with torch.cuda.stream(cls._copy_stream):
+            return staging.to(cls._device, non_blocking=True)
+
     @classmethod
     def generate_from_tokens(
-        cls, tokens: list[int], voicepack: torch.Tensor, speed: float
+        cls, tokens, voicepack: torch.Tensor, speed: float
     ) -> np.ndarray:
         """Generate audio from tokens with moderate memory management
 
         Args:
-            tokens: Token IDs
+            tokens: Token IDs, or a tensor returned by stage_tokens
             voicepack: Voice tensor
             speed: Speed factor
 
@@ -208,26 +457,30 @@ class TTSGPUModel(TTSBaseModel):
         if cls._instance is None:
             raise RuntimeError("GPU model not initialized")
 
+        if isinstance(tokens, torch.Tensor):
+            # Wait for the staged copy, and keep the allocator from reusing
+            # its memory before this stream is done with it
+            stream = torch.cuda.current_stream()
+            stream.wait_stream(cls._copy_stream)
+            tokens.record_stream(stream)
+            n_tokens = tokens.shape[-1] - 2
+        else:
+            n_tokens = len(tokens)
+
         try:
             device = cls._device
-            
-            # Check memory pressure
-            if torch.cuda.is_available():
-                memory_allocated = torch.cuda.memory_allocated(device) / 1e9  # Convert to GB
-                if memory_allocated > 2.0:  # 2GB limit
-                    logger.info(
-                        f"Memory usage above 2GB threshold:{memory_allocated:.2f}GB "
-                        f"Clearing cache"
-                    )
-                    torch.cuda.empty_cache()
-                    import gc
-                    gc.collect()
-            
+
+            if settings.debug_gpu_memory:
+                memory_allocated = torch.cuda.memory_allocated(device) / 1e9
+                logger.debug(f"GPU memory allocated: {memory_allocated:.2f}GB")
+
             # Get reference style with proper device placement
-            ref_s = voicepack[len(tokens)].clone().to(device)
+            ref_s = voicepack[n_tokens].to(device)
             
             # Generate audio
-            audio = forward(cls._instance, tokens, ref_s, speed)
+            audio = forward(
+                cls._instance, tokens, ref_s, speed, encode=cls._encode_text
+            )
             
             return audio
             
@@ -236,10 +489,7 @@ class TTSGPUModel(TTSBaseModel):
                 # On OOM, do a full cleanup and retry
                 if torch.cuda.is_available():
                     logger.warning("Out of memory detected, performing full cleanup")
-                    torch.cuda.synchronize()
-                    torch.cuda.empty_cache()
-                    import gc
-                    gc.collect()
+                    cls.cleanup()
                     
                     # Log memory stats after cleanup
                     memory_allocated = torch.cuda.memory_allocated(device)
@@ -251,12 +501,56 @@ class TTSGPUModel(TTSBaseModel):
                     )
                     
                     # Retry generation
-                    ref_s = voicepack[len(tokens)].clone().to(device)
-                    audio = forward(cls._instance, tokens, ref_s, speed)
+                    ref_s = voicepack[n_tokens].to(device)
+                    audio = forward(
+                        cls._instance, tokens, ref_s, speed, encode=cls._encode_text
+                    )
                     return audio
             raise
-            
-        finally:
-            # Only synchronize at the top level, no empty_cache
-            if torch.cuda.is_available():
-                torch.cuda.synchronize()
+
+    @classmethod
+    def generate_from_tokens_batch(
+        cls,
+        tokens: torch.Tensor,
+        mask: torch.Tensor,
+        voicepack: torch.Tensor,
+        speed: float,
+    ) -> list[np.ndarray]:
+        """Generate audio for a batch of right-padded token sequences
+
+        Args:
+            tokens: Token IDs of shape (batch, max_len), right-padded with 0
+            mask: Boolean mask of shape (batch, max_len), True for real tokens
+            voicepack: Voice tensor
+            speed: Speed factor
+
+        Returns:
+            list[np.ndarray]: Generated audio samples per row
+        """
+        if cls._instance is None:
+            raise RuntimeError("GPU model not initialized")
+
+        device = cls._device
+        tokens = tokens.to(device)
+        lengths = mask.sum(dim=-1).to(device)
+
+        # One reference style per row, selected by that row's token count
+        ref_s = voicepack[lengths.to(voicepack.device)].reshape(
+            lengths.shape[0], -1
+        ).to(device)
+
+        return forward_batch(
+            cls._instance, tokens, lengths, ref_s, speed, encode=cls._encode_text
+        )
+
+    @classmethod
+    def cleanup(cls):
+        """Return cached GPU memory to the driver
+
+        This synchronizes the device and makes later allocations go back to
+        cudaMalloc, so it is only called periodically and on errors.
+        """
+        if torch.cuda.is_available():
+            torch.cuda.synchronize()
+            torch.cuda.empty_cache()
+        gc.collect()
@@ -1,13 +1,15 @@
-import io
+import asyncio
 import os
+import queue
 import re
+import struct
+import threading
 import time
-from functools import lru_cache
-from typing import List, Optional, Tuple
+from collections import OrderedDict
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 
-import aiofiles.os
 import numpy as np
-import scipy.io.wavfile as wavfile
 import torch
 from loguru import logger
 
@@ -17,23 +19,145 @@ from .text_processing import chunker, normalize_text
 from .tts_model import TTSModel
 
 
+# Number of sentences phonemized together ahead of streaming generation
+STREAM_LOOKAHEAD = 2
+# Batches' worth of chunks sorted by token count together on the stitched path
+BATCH_SORT_WINDOW = 4
+
+
+def _wav_header(
+    nsamples: int, sr: int = 24000, bits: int = 16, channels: int = 1
+) -> bytes:
+    """Build a canonical 44-byte PCM WAV header"""
+    block_align = channels * bits // 8
+    data_size = nsamples * block_align
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM format
+        channels,
+        sr,
+        sr * block_align,  # byte rate
+        block_align,
+        bits,
+        b"data",
+        data_size,
+    )
+
+
+def _to_pcm16(audio: np.ndarray) -> np.ndarray:
+    """Return audio as little-endian int16 samples, scaling float input"""
+    if audio.dtype != np.int16:
+        audio = AudioNormalizer.to_int16(audio)
+    return audio.astype("<i2", copy=False)
+
+
 class TTSService:
+    # Voice caches shared across service instances, keyed by voice path.
+    # CPU copies (pinned on CUDA) are bounded by settings.n_cache_voices;
+    # only the most recently used voices are kept resident on the device.
+    _voice_cache: "OrderedDict[str, torch.Tensor]" = OrderedDict()
+    _device_voice_cache: "OrderedDict[str, torch.Tensor]" = OrderedDict()
+    _device_voice_cache_size = 2
+    _voice_cache_lock = threading.Lock()
+    # Generations since startup, drives periodic TTSModel.cleanup()
+    _gen_count = 0
+    _gen_count_lock = threading.Lock()
+    # Voice name -> path, built on first use and updated by combine_voices
+    _voice_index: Optional[Dict[str, str]] = None
+    # (voices dir mtime_ns, sorted voice names) from the last listing
+    _voice_list_cache: Optional[Tuple[int, List[str]]] = None
+
     def __init__(self, output_dir: str = None):
         self.output_dir = output_dir
         self.model = TTSModel.get_instance()
 
-    @staticmethod
-    @lru_cache(maxsize=3)  # Cache up to 3 most recently used voices
-    def _load_voice(voice_path: str) -> torch.Tensor:
-        """Load and cache a voice model"""
-        return torch.load(
-            voice_path, map_location=TTSModel.get_device(), weights_only=True
-        )
+    @classmethod
+    def _load_voice(cls, voice_path: str) -> torch.Tensor:
+        """Load and cache a voice model
+
+        Returns a fresh view sharing storage with the cache entry, so callers
+        never hold the cached tensor object itself.
+        """
+        voicepack = cls._get_cached_voice(voice_path)
+        return voicepack.view(voicepack.shape)
+
+    @classmethod
+    def _get_cached_voice(cls, voice_path: str) -> torch.Tensor:
+        """Get a voice from the caches, loading it from disk on a miss"""
+        device = TTSModel.get_device()
+        with cls._voice_cache_lock:
+            voicepack = cls._device_voice_cache.get(voice_path)
+            if voicepack is not None:
+                cls._device_voice_cache.move_to_end(voice_path)
+                return voicepack
+
+            voicepack = cls._voice_cache.get(voice_path)
+            if voicepack is not None:
+                cls._voice_cache.move_to_end(voice_path)
+            else:
+                try:
+                    voicepack = torch.load(
+                        voice_path, map_location="cpu", weights_only=True
+                    )
+                except FileNotFoundError:
+                    # Deleted since the index was built; forget it
+                    name = os.path.splitext(os.path.basename(voice_path))[0]
+                    if cls._voice_index and cls._voice_index.get(name) == voice_path:
+                        del cls._voice_index[name]
+                    raise ValueError(f"Voice not found: {name}")
+                voicepack = voicepack.detach().requires_grad_(False)
+                if device.startswith("cuda"):
+                    voicepack = voicepack.contiguous().pin_memory()
+                cls._voice_cache[voice_path] = voicepack
+                while len(cls._voice_cache) > settings.n_cache_voices:
+                    cls._voice_cache.popitem(last=False)
+
+            if device == "cpu":
+                return voicepack
+
+            voicepack = voicepack.to(device, non_blocking=True)
+            cls._device_voice_cache[voice_path] = voicepack
+            while len(cls._device_voice_cache) > cls._device_voice_cache_size:
+                cls._device_voice_cache.popitem(last=False)
+            return voicepack
+
+    @classmethod
+    def _evict_voice(cls, voice_path: str):
+        """Drop a voice from the caches, e.g. after its file was rewritten"""
+        with cls._voice_cache_lock:
+            cls._voice_cache.pop(voice_path, None)
+            cls._device_voice_cache.pop(voice_path, None)
+
+    @classmethod
+    def refresh_voices(cls) -> List[str]:
+        """Rebuild the voice name to path index from the voices directory"""
+        index = {}
+        try:
+            with os.scandir(TTSModel.VOICES_DIR) as it:
+                for entry in it:
+                    if entry.name.endswith(".pt"):
+                        index[entry.name[:-3]] = entry.path
+        except OSError as e:
+            logger.error(f"Error indexing voices: {str(e)}")
+        cls._voice_index = index
+        return sorted(index)
 
     def _get_voice_path(self, voice_name: str) -> Optional[str]:
         """Get the path to a voice file"""
-        voice_path = os.path.join(TTSModel.VOICES_DIR, f"{voice_name}.pt")
-        return voice_path if os.path.exists(voice_path) else None
+        if TTSService._voice_index is None:
+            self.refresh_voices()
+        voice_path = TTSService._voice_index.get(voice_name)
+        if voice_path is None:
+            # May have been added by another worker since the index was built
+            candidate = os.path.join(TTSModel.VOICES_DIR, f"{voice_name}.pt")
+            if os.path.exists(candidate):
+                TTSService._voice_index[voice_name] = voice_path = candidate
+        return voice_path
 
     def _generate_audio(
         self, text: str, voice: str, speed: float, stitch_long_output: bool = True
@@ -42,13 +166,29 @@ class TTSService:
         audio, processing_time = self._generate_audio_internal(
             text, voice, speed, stitch_long_output
         )
+        if self._count_generation():
+            TTSModel.cleanup()
         return audio, processing_time
 
+    @classmethod
+    def _count_generation(cls) -> bool:
+        """Count a finished generation
+
+        Returns:
+            bool: True every settings.cleanup_every_n generations, when the
+            caller should run TTSModel.cleanup()
+        """
+        with cls._gen_count_lock:
+            cls._gen_count += 1
+            return cls._gen_count % settings.cleanup_every_n == 0
+
+    @torch.inference_mode()
     def _generate_audio_internal(
         self, text: str, voice: str, speed: float, stitch_long_output: bool = True
     ) -> Tuple[torch.Tensor, float]:
         """Generate audio and measure processing time"""
-        start_time = time.time()
+        start_time = time.perf_counter()
+        generating = False
 
         try:
             # Normalize text once at the start
@@ -66,62 +206,214 @@ class TTSService:
 
             # Load voice using cached loader
             voicepack = self._load_voice(voice_path)
+            generating = True
 
-            # For non-streaming, preprocess all chunks first
             if stitch_long_output:
-                # Preprocess all chunks to phonemes/tokens
+                # Tokenize on a producer thread while batches generate here
+                batch_size = settings.max_batch_size
+                chunk_queue = queue.Queue(maxsize=2 * batch_size)
+                stop = threading.Event()
+                producer = threading.Thread(
+                    target=self._tokenize_chunks,
+                    args=(text, voice[0], chunk_queue, stop),
+                    daemon=True,
+                )
+                producer.start()
+
+                # Generate audio window by window as chunks arrive. Within a
+                # window, chunks are batched by token count to keep padding
+                # low, and the results are put back in text order.
                 chunks_data = []
-                for chunk in chunker.split_text(text):
-                    try:
-                        phonemes, tokens = TTSModel.process_text(chunk, voice[0])
-                        chunks_data.append((chunk, tokens))
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to process chunk: '{chunk}'. Error: {str(e)}"
+                audio_chunks = []
+                try:
+                    finished = False
+                    while not finished:
+                        window = []
+                        while len(window) < BATCH_SORT_WINDOW * batch_size:
+                            item = chunk_queue.get()
+                            if item is None:
+                                finished = True
+                                break
+                            window.append(len(chunks_data))
+                            chunks_data.append(item)
+                        if not window:
+                            break
+
+                        window_audio = {}
+                        by_length = sorted(
+                            window, key=lambda i: len(chunks_data[i][1])
                         )
-                        continue
+                        for start in range(0, len(by_length), batch_size):
+                            bucket = by_length[start : start + batch_size]
+                            bucket_audio = self._generate_bucket(
+                                bucket, chunks_data, voicepack, speed
+                            )
+                            window_audio.update(zip(bucket, bucket_audio))
+
+                        for i in window:
+                            if window_audio[i] is not None:
+                                # Keep only the int16 copy, at half the float size
+                                audio_chunks.append(
+                                    AudioNormalizer.to_int16(window_audio.pop(i))
+                                )
+                            else:
+                                logger.error(
+                                    f"No audio generated for chunk: '{chunks_data[i][0]}'"
+                                )
+                finally:
+                    # Unblock the producer if generation stopped early
+                    stop.set()
+                    producer.join()
 
                 if not chunks_data:
                     raise ValueError("No chunks were processed successfully")
 
-                # Generate audio for all chunks
-                audio_chunks = []
-                for chunk, tokens in chunks_data:
-                    try:
-                        chunk_audio = TTSModel.generate_from_tokens(
-                            tokens, voicepack, speed
-                        )
-                        if chunk_audio is not None:
-                            audio_chunks.append(chunk_audio)
-                        else:
-                            logger.error(f"No audio generated for chunk: '{chunk}'")
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to generate audio for chunk: '{chunk}'. Error: {str(e)}"
-                        )
-                        continue
-
                 if not audio_chunks:
                     raise ValueError("No audio chunks were generated successfully")
 
-                # Concatenate all chunks
-                audio = (
-                    np.concatenate(audio_chunks)
-                    if len(audio_chunks) > 1
-                    else audio_chunks[0]
-                )
+                # Chunk lengths are only known once generated, so join once
+                audio = np.concatenate(audio_chunks)
+                del audio_chunks
+
             else:
                 # Process single chunk
                 phonemes, tokens = TTSModel.process_text(text, voice[0])
-                audio = TTSModel.generate_from_tokens(tokens, voicepack, speed)
+                audio = AudioNormalizer.to_int16(
+                    TTSModel.generate_from_tokens(tokens, voicepack, speed)
+                )
 
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             return audio, processing_time
 
         except Exception as e:
             logger.error(f"Error in audio generation: {str(e)}")
+            # Validation errors leave nothing to release
+            if generating:
+                TTSModel.cleanup()
             raise
 
+    @staticmethod
+    def _pad_batch(token_lists: List[List[int]]) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Right-pad token lists into a (batch, max_len) tensor and its mask"""
+        lengths = torch.tensor([len(tokens) for tokens in token_lists])
+        padded = torch.zeros((len(token_lists), int(lengths.max())), dtype=torch.long)
+        for i, tokens in enumerate(token_lists):
+            padded[i, : len(tokens)] = torch.tensor(tokens, dtype=torch.long)
+        mask = torch.arange(padded.shape[1])[None, :] < lengths[:, None]
+        device = TTSModel.get_device()
+        return padded.to(device), mask.to(device)
+
+    def _generate_bucket(
+        self,
+        bucket: List[int],
+        chunks_data: List[Tuple[str, List[int]]],
+        voicepack: torch.Tensor,
+        speed: float,
+    ) -> List[Optional[np.ndarray]]:
+        """Generate audio for a bucket of chunks, one chunk at a time on failure"""
+        try:
+            tokens, mask = self._pad_batch([chunks_data[i][1] for i in bucket])
+            return TTSModel.generate_from_tokens_batch(tokens, mask, voicepack, speed)
+        except Exception as e:
+            logger.warning(
+                f"Batched generation failed, falling back to per-chunk: {str(e)}"
+            )
+
+        bucket_audio = []
+        for i in bucket:
+            chunk, tokens = chunks_data[i]
+            try:
+                bucket_audio.append(
+                    TTSModel.generate_from_tokens(tokens, voicepack, speed)
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to generate audio for chunk: '{chunk}'. Error: {str(e)}"
+                )
+                bucket_audio.append(None)
+        return bucket_audio
+
+    def _tokenize_chunks(
+        self,
+        text: str,
+        language: str,
+        chunk_queue: queue.Queue,
+        stop: threading.Event,
+    ):
+        """Split and tokenize text into a bounded queue, ending with None
+
+        Returns early once stop is set, so a consumer that gave up cannot
+        leave this thread blocked on a full queue.
+        """
+        try:
+            for chunk, tokens in chunker.split_text_tokens(
+                text, language, group_size=settings.max_batch_size
+            ):
+                item = (chunk, TTSModel.prepare_tokens(tokens))
+                if not self._put_unless_stopped(chunk_queue, item, stop):
+                    return
+        except Exception as e:
+            logger.error(f"Error splitting text: {str(e)}")
+        self._put_unless_stopped(chunk_queue, None, stop)
+
+    @staticmethod
+    def _put_unless_stopped(
+        chunk_queue: queue.Queue, item, stop: threading.Event
+    ) -> bool:
+        """Put item on a bounded queue, giving up once stop is set"""
+        while not stop.is_set():
+            try:
+                chunk_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    async def _produce_tokens(
+        self, text: str, language: str, chunk_queue: asyncio.Queue
+    ):
+        """Tokenize chunks in the executor and feed them to a bounded queue"""
+        loop = asyncio.get_running_loop()
+        try:
+            # The first sentence goes out unpacked and small lookahead groups
+            # follow it, to keep the first chunk's latency low
+            chunks = chunker.split_text_tokens(
+                text, language, group_size=STREAM_LOOKAHEAD, pack_first=False
+            )
+            while True:
+                item = await loop.run_in_executor(None, self._next_staged, chunks)
+                if item is None:
+                    break
+                await chunk_queue.put(item)
+        except Exception as e:
+            logger.error(f"Error splitting text for streaming: {str(e)}")
+        await chunk_queue.put(None)
+
+    @staticmethod
+    def _next_staged(chunks) -> Optional[Tuple[str, object]]:
+        """Take the next chunk and start its token copy to the model's device
+
+        Runs in an executor thread while the previous chunk is generating, so
+        the copy overlaps that chunk's compute.
+        """
+        item = next(chunks, None)
+        if item is None:
+            return None
+        chunk, tokens = item
+        return chunk, TTSModel.stage_tokens(TTSModel.prepare_tokens(tokens))
+
+    def _generate_tokens(
+        self, tokens, voicepack: torch.Tensor, speed: float
+    ) -> Optional[np.ndarray]:
+        """Generate audio for a single chunk's tokens, blocking
+
+        Runs in an executor thread; inference mode is thread-local so it is
+        entered here rather than by the calling coroutine.
+        """
+        with torch.inference_mode():
+            audio = TTSModel.generate_from_tokens(tokens, voicepack, speed)
+        return AudioNormalizer.to_int16(audio) if audio is not None else None
+
     async def generate_audio_stream(
         self,
         text: str,
@@ -132,73 +424,109 @@ class TTSService:
     ):
         """Generate and yield audio chunks as they're generated for real-time streaming"""
         try:
-            stream_start = time.time()
+            stream_start = time.perf_counter()
             # Create normalizer for consistent audio levels
             stream_normalizer = AudioNormalizer()
 
             # Input validation and preprocessing
             if not text:
                 raise ValueError("Text is empty")
-            preprocess_start = time.time()
             normalized = normalize_text(text)
             if not normalized:
                 raise ValueError("Text is empty after preprocessing")
             text = str(normalized)
-            logger.debug(
-                f"Text preprocessing took: {(time.time() - preprocess_start)*1000:.1f}ms"
-            )
 
             # Voice validation and loading
-            voice_start = time.time()
             voice_path = self._get_voice_path(voice)
             if not voice_path:
                 raise ValueError(f"Voice not found: {voice}")
             voicepack = self._load_voice(voice_path)
-            logger.debug(
-                f"Voice loading took: {(time.time() - voice_start)*1000:.1f}ms"
-            )
 
             # Process chunks as they're generated
             is_first = True
             chunks_processed = 0
 
-            # Process chunks as they come from generator
-            chunk_gen = chunker.split_text(text)
-            current_chunk = next(chunk_gen, None)
+            # Tokenization runs as a producer task feeding a bounded queue, so
+            # the next chunks are phonemized on CPU while the current one is
+            # generating. Inference and encoding run in the default executor,
+            # with the next chunk's inference started before the current chunk
+            # is encoded and yielded.
+            loop = asyncio.get_running_loop()
+            chunk_queue = asyncio.Queue(maxsize=4)
+            producer = asyncio.create_task(
+                self._produce_tokens(text, voice[0], chunk_queue)
+            )
 
-            while current_chunk is not None:
-                next_chunk = next(chunk_gen, None)  # Peek at next chunk
-                chunks_processed += 1
-                try:
-                    # Process text and generate audio
-                    phonemes, tokens = TTSModel.process_text(current_chunk, voice[0])
-                    chunk_audio = TTSModel.generate_from_tokens(
-                        tokens, voicepack, speed
-                    )
+            def submit(item):
+                if item is None:
+                    return None
+                return loop.run_in_executor(
+                    None, self._generate_tokens, item[1], voicepack, speed
+                )
 
-                    if chunk_audio is not None:
-                        # Convert chunk with proper streaming header handling
-                        chunk_bytes = AudioService.convert_audio(
-                            chunk_audio,
-                            24000,
-                            output_format,
-                            is_first_chunk=is_first,
-                            normalizer=stream_normalizer,
-                            is_last_chunk=(next_chunk is None),  # Last if no next chunk
-                            stream=True  # Ensure proper streaming format handling
+            next_task = None
+            try:
+                current = await chunk_queue.get()
+                current_task = submit(current)
+
+                while current is not None:
+                    current_chunk = current[0]
+                    chunks_processed += 1
+                    try:
+                        chunk_audio = await current_task
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to generate audio for chunk: '{current_chunk}'. Error: {str(e)}"
                         )
+                        chunk_audio = None
+                        await loop.run_in_executor(None, TTSModel.cleanup)
+
+                    # Prefetch: one chunk of inference in flight while encoding
+                    next_item = await chunk_queue.get()  # Peek at next chunk
+                    next_task = submit(next_item)
 
-                        yield chunk_bytes
-                        is_first = False
+                    if chunk_audio is not None:
+                        try:
+                            # Convert chunk with proper streaming header handling
+                            chunk_bytes = await loop.run_in_executor(
+                                None,
+                                partial(
+                                    AudioService.convert_audio,
+                                    chunk_audio,
+                                    24000,
+                                    output_format,
+                                    is_first_chunk=is_first,
+                                    normalizer=stream_normalizer,
+                                    is_last_chunk=(next_item is None),  # Last if no next chunk
+                                    stream=True,  # Ensure proper streaming format handling
+                                    input_is_int16=True,
+                                ),
+                            )
+                        except Exception as e:
+                            logger.error(
+                                f"Failed to convert audio for chunk: '{current_chunk}'. Error: {str(e)}"
+                            )
+                        else:
+                            yield chunk_bytes
+                            is_first = False
                     else:
                         logger.error(f"No audio generated for chunk: '{current_chunk}'")
 
-                except Exception as e:
-                    logger.error(
-                        f"Failed to generate audio for chunk: '{current_chunk}'. Error: {str(e)}"
-                    )
+                    current, current_task = next_item, next_task  # Move to next chunk
+                    next_task = None
+            finally:
+                # Stop the producer and drop a prefetched result nobody will
+                # consume, e.g. on client disconnect
+                producer.cancel()
+                if next_task is not None:
+                    next_task.cancel()
 
-                current_chunk = next_chunk  # Move to next chunk
+            logger.debug(
+                f"Streamed {chunks_processed} chunks in "
+                f"{(time.perf_counter() - stream_start)*1000:.1f}ms"
+            )
+            if self._count_generation():
+                await loop.run_in_executor(None, TTSModel.cleanup)
 
         except Exception as e:
             logger.error(f"Error in audio generation stream: {str(e)}")
@@ -207,30 +535,31 @@ class TTSService:
     def _save_audio(self, audio: torch.Tensor, filepath: str):
         """Save audio to file"""
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        wavfile.write(filepath, 24000, audio)
+        pcm = _to_pcm16(audio)
+        with open(filepath, "wb") as f:
+            f.write(_wav_header(len(pcm)))
+            pcm.tofile(f)
 
     def _audio_to_bytes(self, audio: torch.Tensor) -> bytes:
         """Convert audio tensor to WAV bytes"""
-        buffer = io.BytesIO()
-        wavfile.write(buffer, 24000, audio)
-        return buffer.getvalue()
+        pcm = _to_pcm16(audio)
+        return _wav_header(len(pcm)) + pcm.tobytes()
 
     async def combine_voices(self, voices: List[str]) -> str:
         """Combine multiple voices into a new voice"""
         if len(voices) < 2:
             raise ValueError("At least 2 voices are required for combination")
 
-        # Load voices
-        t_voices: List[torch.Tensor] = []
+        # Load voices on CPU one at a time into a running sum
+        v_sum: Optional[torch.Tensor] = None
         v_name: List[str] = []
 
         for voice in voices:
             try:
                 voice_path = os.path.join(TTSModel.VOICES_DIR, f"{voice}.pt")
-                voicepack = torch.load(
-                    voice_path, map_location=TTSModel.get_device(), weights_only=True
-                )
-                t_voices.append(voicepack)
+                voicepack = torch.load(voice_path, map_location="cpu", weights_only=True)
+                v_sum = voicepack if v_sum is None else v_sum.add_(voicepack)
+                del voicepack
                 v_name.append(voice)
             except Exception as e:
                 raise ValueError(f"Failed to load voice {voice}: {str(e)}")
@@ -238,12 +567,15 @@ class TTSService:
         # Combine voices
         try:
             f: str = "_".join(v_name)
-            v = torch.mean(torch.stack(t_voices), dim=0)
+            v = v_sum.div_(len(v_name))
             combined_path = os.path.join(TTSModel.VOICES_DIR, f"{f}.pt")
 
             # Save combined voice
             try:
                 torch.save(v, combined_path)
+                self._evict_voice(combined_path)
+                if TTSService._voice_index is not None:
+                    TTSService._voice_index[f] = combined_path
             except Exception as e:
                 raise RuntimeError(
                     f"Failed to save combined voice to {combined_path}: {str(e)}"
@@ -258,12 +590,19 @@ class TTSService:
 
     async def list_voices(self) -> List[str]:
         """List all available voices"""
-        voices = []
         try:
-            it = await aiofiles.os.scandir(TTSModel.VOICES_DIR)
-            for entry in it:
-                if entry.name.endswith(".pt"):
-                    voices.append(entry.name[:-3])  # Remove .pt extension
-        except Exception as e:
+            # Rescan only when the directory changed since the last listing
+            mtime = os.stat(TTSModel.VOICES_DIR).st_mtime_ns
+            cached = TTSService._voice_list_cache
+            if cached is not None and cached[0] == mtime:
+                return list(cached[1])
+
+            with os.scandir(TTSModel.VOICES_DIR) as it:
+                voices = sorted(
+                    entry.name[:-3] for entry in it if entry.name.endswith(".pt")
+                )  # Remove .pt extension
+            TTSService._voice_list_cache = (mtime, voices)
+            return list(voices)
+        except OSError as e:
             logger.error(f"Error listing voices: {str(e)}")
-        return sorted(voices)
+            return []
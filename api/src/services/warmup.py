@@ -31,7 +31,7 @@ class WarmupService:
         for voice_file in voice_files[:n_voices_cache]:
             try:
                 voice_path = os.path.join(TTSModel.VOICES_DIR, voice_file)
-                # load using service, lru cache
+                # load using service voice cache
                 voicepack = self.tts_service._load_voice(voice_path)
                 loaded_voices.append(
                     (voice_file[:-3], voicepack)
@@ -47,6 +47,14 @@ class WarmupService:
         self, warmup_text: str, loaded_voices: List[Tuple[str, torch.Tensor]]
     ):
         """Warm up voice inference and streaming"""
+        if settings.use_torch_compile:
+            # Compile before the warmup runs so they trigger the first compilation
+            try:
+                TTSModel.compile_model()
+                logger.info("Compiled model with torch.compile")
+            except Exception as e:
+                logger.warning(f"Model compilation failed, running eager: {e}")
+
         n_warmups = 1
         for voice_name, _ in loaded_voices[:n_warmups]:
             try:
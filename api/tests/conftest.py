@@ -55,6 +55,12 @@ mock_settings_module = Mock()
 mock_settings = Mock()
 mock_settings.model_dir = "/mock/model/dir"
 mock_settings.onnx_model_path = "mock.onnx"
+mock_settings.max_batch_size = 8
+mock_settings.n_cache_voices = 3
+mock_settings.target_chunk_tokens = 128
+mock_settings.cuda_alloc_conf = ""
+mock_settings.cleanup_every_n = 256
+mock_settings.debug_gpu_memory = False
 mock_settings_module.settings = mock_settings
 sys.modules["api.src.core.config"] = mock_settings_module
 
@@ -129,3 +129,27 @@ def test_buffer_position_after_conversion(sample_audio):
     # Convert again to ensure buffer was properly reset
     result2 = AudioService.convert_audio(audio_data, sample_rate, "wav")
     assert len(result) == len(result2)
+
+
+def test_to_int16_clips():
+    """Test float to int16 conversion clips out-of-range samples"""
+    result = AudioNormalizer.to_int16(np.array([0.0, 0.5, 2.0, -2.0], dtype=np.float32))
+    assert result.dtype == np.int16
+    assert result.tolist() == [0, 16383, 32767, -32768]
+
+
+def test_to_int16_leaves_input_unchanged():
+    """Test float to int16 conversion does not write into the caller's array"""
+    audio = np.array([0.25, -0.5], dtype=np.float32)
+    AudioNormalizer.to_int16(audio)
+    assert audio.tolist() == [0.25, -0.5]
+
+
+def test_convert_int16_input_skips_scaling(sample_audio):
+    """Test int16 input is passed through without rescaling"""
+    audio_data, sample_rate = sample_audio
+    pcm = AudioNormalizer.to_int16(audio_data)
+    result = AudioService.convert_audio(
+        pcm, sample_rate, "pcm", is_last_chunk=True, input_is_int16=True
+    )
+    assert result == pcm.tobytes()
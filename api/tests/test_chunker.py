@@ -4,7 +4,7 @@ from unittest.mock import patch
 
 import pytest
 
-from api.src.services.text_processing import chunker
+from api.src.services.text_processing import VOCAB, chunker
 
 
 @pytest.fixture(autouse=True)
@@ -12,6 +12,7 @@ def mock_settings():
     """Mock settings for all tests"""
     with patch("api.src.services.text_processing.chunker.settings") as mock_settings:
         mock_settings.max_chunk_size = 300
+        mock_settings.target_chunk_tokens = 128
         yield mock_settings
 
 
@@ -44,3 +45,56 @@ def test_split_text_with_custom_chunk_size():
     assert chunks[0] == "First part,"
     assert chunks[1] == "second part,"
     assert chunks[2] == "third part."
+
+
+def test_split_text_tokens_packs_to_budget():
+    """Test sentences are packed until the token budget would overflow"""
+    with patch.object(
+        chunker, "phonemize_batch", side_effect=lambda texts, language: texts
+    ), patch.object(chunker, "tokenize", side_effect=lambda ps: [1] * len(ps)):
+        # Bucket 16 leaves 14 tokens once start/end tokens are added
+        chunks = list(
+            chunker.split_text_tokens("Aaaa. Bbbb. Cccc.", target_tokens=13, pad_to=[16])
+        )
+
+    assert chunks == [
+        ("Aaaa. Bbbb.", [1] * 5 + [VOCAB[" "]] + [1] * 5),
+        ("Cccc.", [1] * 5),
+    ]
+
+
+def test_split_text_tokens_falls_back_on_length_mismatch():
+    """Test a batch result of the wrong length is redone per sentence"""
+    with patch.object(
+        chunker, "phonemize_batch", return_value=["merged"]
+    ), patch.object(
+        chunker, "phonemize", side_effect=lambda text, language: text
+    ) as mock_phonemize, patch.object(
+        chunker, "tokenize", side_effect=lambda ps: [1] * len(ps)
+    ):
+        chunks = list(
+            chunker.split_text_tokens("Aaaa. Bbbb.", target_tokens=8, pad_to=[8])
+        )
+
+    assert mock_phonemize.call_count == 2
+    assert chunks == [("Aaaa.", [1] * 5), ("Bbbb.", [1] * 5)]
+
+
+def test_split_text_tokens_first_chunk_unpacked():
+    """Test pack_first=False yields the first sentence on its own"""
+    with patch.object(
+        chunker, "phonemize_batch", side_effect=lambda texts, language: texts
+    ) as mock_phonemize, patch.object(
+        chunker, "tokenize", side_effect=lambda ps: [1] * len(ps)
+    ):
+        chunks = list(
+            chunker.split_text_tokens(
+                "Aaaa. Bbbb. Cccc.", target_tokens=16, pad_to=[16], pack_first=False
+            )
+        )
+
+    assert mock_phonemize.call_args_list[0].args[0] == ["Aaaa."]
+    assert chunks == [
+        ("Aaaa.", [1] * 5),
+        ("Bbbb. Cccc.", [1] * 5 + [VOCAB[" "]] + [1] * 5),
+    ]
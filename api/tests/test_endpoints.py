@@ -168,6 +168,18 @@ async def test_combine_voices_string_success(mock_tts_service, async_client):
     )
 
 
+@pytest.mark.asyncio
+async def test_refresh_voices(mock_tts_service, async_client):
+    """Test rebuilding the voice index"""
+    mock_tts_service.refresh_voices.return_value = ["af", "af_bella"]
+
+    response = await async_client.post("/v1/audio/voices/refresh")
+
+    assert response.status_code == 200
+    assert response.json() == {"voices": ["af", "af_bella"]}
+    mock_tts_service.refresh_voices.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_combine_voices_single_voice(mock_tts_service, async_client):
     """Test combining single voice returns same voice"""
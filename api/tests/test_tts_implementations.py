@@ -9,7 +9,12 @@ import torch
 
 from api.src.services.tts_base import TTSBaseModel
 from api.src.services.tts_cpu import TTSCPUModel
-from api.src.services.tts_gpu import TTSGPUModel, length_to_mask
+from api.src.services.tts_gpu import (
+    TTSGPUModel,
+    forward,
+    forward_batch,
+    length_to_mask,
+)
 
 
 # Base Model Tests
@@ -199,3 +204,103 @@ def test_gpu_process_text():
         phonemes, tokens = TTSGPUModel.process_text("test", "en")
         assert phonemes == "test phonemes"
         assert tokens == [1, 2, 3]  # GPU implementation doesn't add start/end tokens
+
+
+def test_generate_from_tokens_batch_fallback():
+    """Test default batched generation runs one unpadded row at a time"""
+    tokens = torch.tensor([[1, 2, 3], [4, 0, 0]])
+    mask = torch.tensor([[True, True, True], [True, False, False]])
+    with patch.object(
+        TTSCPUModel, "generate_from_tokens", return_value=np.zeros(10)
+    ) as mock_generate:
+        result = TTSCPUModel.generate_from_tokens_batch(tokens, mask, torch.zeros(1), 1.0)
+
+    assert len(result) == 2
+    assert mock_generate.call_args_list[0].args[0] == [1, 2, 3]
+    assert mock_generate.call_args_list[1].args[0] == [4]
+
+
+def test_forward_batch_matches_forward():
+    """Test batched inference gives each row the audio of an unbatched pass"""
+    from munch import Munch
+
+    from api.src.builds.istftnet import Decoder
+    from api.src.builds.models import ProsodyPredictor, TextEncoder
+
+    torch.manual_seed(0)
+    model = Munch(
+        predictor=ProsodyPredictor(style_dim=128, d_hid=512, nlayers=1).eval(),
+        text_encoder=TextEncoder(
+            channels=512, kernel_size=5, depth=1, n_symbols=178
+        ).eval(),
+        decoder=Decoder(dim_in=512, style_dim=128, dim_out=80).eval(),
+    )
+    embedding = torch.nn.Embedding(178, 512)
+
+    def encode(model, tokens, text_mask):
+        return embedding(tokens)
+
+    rows = [[5, 6, 7, 8, 9], [10, 11], [12, 13, 14]]
+    ref_s = torch.randn(len(rows), 256)
+    # A high speed clamps every duration to one frame, so rounding noise
+    # cannot change the frame counts being compared
+    speed = 100.0
+
+    torch.manual_seed(1)
+    expected = [
+        forward(model, row, ref_s[i : i + 1], speed, encode=encode)
+        for i, row in enumerate(rows)
+    ]
+
+    tokens = torch.tensor([row + [0] * (5 - len(row)) for row in rows])
+    lengths = torch.tensor([len(row) for row in rows])
+    torch.manual_seed(1)
+    result = forward_batch(model, tokens, lengths, ref_s, speed, encode=encode)
+
+    assert len(result) == len(rows)
+    for audio, reference in zip(result, expected):
+        assert audio.shape == reference.shape
+        np.testing.assert_allclose(audio, reference, atol=1e-4)
+
+
+@patch("torch.cuda.is_available", return_value=False)
+def test_gpu_stage_tokens_without_cuda(mock_cuda_available):
+    """Test GPU stage_tokens leaves tokens on the host when CUDA is unavailable"""
+    assert TTSGPUModel.stage_tokens([1, 2]) == [1, 2]
+    assert TTSCPUModel.stage_tokens([0, 1, 2, 0]) == [0, 1, 2, 0]
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+def test_cuda_graph_replay_outside_inference_mode(monkeypatch):
+    """Test a graph captured in inference mode replays from a no_grad caller"""
+    from munch import Munch
+
+    from api.src.services.tts_gpu import encode_text
+
+    class Bert(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.embedding = torch.nn.Embedding(178, 16)
+
+        def forward(self, tokens, attention_mask):
+            return self.embedding(tokens) * attention_mask[..., None]
+
+    model = Munch(
+        bert=Bert().cuda().eval(), bert_encoder=torch.nn.Linear(16, 8).cuda().eval()
+    )
+    monkeypatch.setattr("api.src.services.tts_gpu.settings.use_cuda_graphs", True)
+    monkeypatch.setattr(TTSGPUModel, "_instance", model)
+    monkeypatch.setattr(TTSGPUModel, "_graph_cache", {})
+
+    tokens = torch.tensor([[0, 5, 6, 0]], device="cuda")
+    text_mask = torch.zeros_like(tokens, dtype=torch.bool)
+    # Warmup captures the graph under inference mode
+    with torch.inference_mode():
+        TTSGPUModel._encode_text(model, tokens, text_mask)
+
+    with torch.no_grad():
+        result = TTSGPUModel._encode_text(model, tokens, text_mask)
+        expected = encode_text(model, tokens, text_mask)
+
+    assert not result.is_inference()
+    torch.testing.assert_close(result, expected)
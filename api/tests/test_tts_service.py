@@ -1,6 +1,9 @@
 """Tests for TTSService"""
 
+import asyncio
 import os
+import queue
+import threading
 from unittest.mock import MagicMock, call, patch
 
 import numpy as np
@@ -9,6 +12,7 @@ import torch
 from onnxruntime import InferenceSession
 
 from api.src.core.config import settings
+from api.src.services.audio import AudioNormalizer
 from api.src.services.tts_cpu import TTSCPUModel
 from api.src.services.tts_gpu import TTSGPUModel
 from api.src.services.tts_model import TTSModel
@@ -46,6 +50,26 @@ def sample_audio():
     return np.sin(2 * np.pi * frequency * t).astype(np.float32)
 
 
+@pytest.fixture
+def pipeline_model(monkeypatch):
+    """Patch TTSModel and voice loading for the generation pipelines"""
+    mock_model = MagicMock()
+    mock_model.get_device.return_value = "cpu"
+    mock_model.prepare_tokens.side_effect = lambda tokens: tokens
+    mock_model.stage_tokens.side_effect = lambda tokens: tokens
+    monkeypatch.setattr("api.src.services.tts_service.TTSModel", mock_model)
+    monkeypatch.setattr(
+        "api.src.services.tts_service.normalize_text", lambda text: text
+    )
+    monkeypatch.setattr(
+        TTSService, "_get_voice_path", MagicMock(return_value="/mock/voices/af.pt")
+    )
+    monkeypatch.setattr(
+        TTSService, "_load_voice", MagicMock(return_value=torch.zeros(1))
+    )
+    return mock_model
+
+
 def test_audio_to_bytes(tts_service, sample_audio):
     """Test converting audio tensor to bytes"""
     audio_bytes = tts_service._audio_to_bytes(sample_audio)
@@ -53,36 +77,38 @@ def test_audio_to_bytes(tts_service, sample_audio):
     assert len(audio_bytes) > 0
 
 
+def test_audio_to_bytes_wav_header(tts_service, sample_audio):
+    """Test WAV bytes carry a 44-byte PCM16 header followed by samples"""
+    audio_bytes = tts_service._audio_to_bytes(sample_audio)
+    assert audio_bytes[:4] == b"RIFF"
+    assert audio_bytes[8:16] == b"WAVEfmt "
+    assert audio_bytes[36:40] == b"data"
+    assert len(audio_bytes) == 44 + 2 * len(sample_audio)
+
+
 @pytest.mark.asyncio
-async def test_list_voices(tts_service):
+async def test_list_voices(tts_service, tmp_path, monkeypatch):
     """Test listing available voices"""
+    for name in ["voice2.pt", "voice1.pt", "notes.txt"]:
+        (tmp_path / name).write_bytes(b"")
+    monkeypatch.setattr(TTSModel, "VOICES_DIR", str(tmp_path))
+    TTSService._voice_list_cache = None
 
-    # Override list_voices for testing
-    # # TODO:
-    # Whatever aiofiles does here pathing aiofiles vs aiofiles.os
-    # I am thoroughly confused by it.
-    # Cheating the test as it seems to work in the real world (for now)
-    async def mock_list_voices():
-        return ["voice1", "voice2"]
-
-    tts_service.list_voices = mock_list_voices
+    voices = await tts_service.list_voices()
+    assert voices == ["voice1", "voice2"]
 
+    # New voices are picked up once the directory changes
+    (tmp_path / "voice3.pt").write_bytes(b"")
+    os.utime(tmp_path, ns=(0, os.stat(tmp_path).st_mtime_ns + 1))
     voices = await tts_service.list_voices()
-    assert len(voices) == 2
-    assert "voice1" in voices
-    assert "voice2" in voices
+    assert voices == ["voice1", "voice2", "voice3"]
 
 
 @pytest.mark.asyncio
-async def test_list_voices_error(tts_service):
+async def test_list_voices_error(tts_service, tmp_path, monkeypatch):
     """Test error handling in list_voices"""
-
-    # Override list_voices for testing
-    # TODO: See above.
-    async def mock_list_voices():
-        return []
-
-    tts_service.list_voices = mock_list_voices
+    monkeypatch.setattr(TTSModel, "VOICES_DIR", str(tmp_path / "missing"))
+    TTSService._voice_list_cache = None
 
     voices = await tts_service.list_voices()
     assert voices == []
@@ -135,6 +161,7 @@ def mock_settings():
     """Mock settings for all tests"""
     with patch("api.src.services.text_processing.chunker.settings") as mock_settings:
         mock_settings.max_chunk_size = 300
+        mock_settings.target_chunk_tokens = 128
         yield mock_settings
 
 
@@ -221,15 +248,17 @@ def test_save_audio(tts_service, sample_audio, tmp_path):
 async def test_combine_voices(tts_service):
     """Test combining multiple voices"""
     # Setup mocks for torch operations
-    with patch("torch.load", return_value=torch.tensor([1.0, 2.0])), patch(
-        "torch.stack", return_value=torch.tensor([[1.0, 2.0], [3.0, 4.0]])
-    ), patch("torch.mean", return_value=torch.tensor([2.0, 3.0])), patch(
-        "torch.save"
-    ), patch("os.path.exists", return_value=True):
+    with patch(
+        "torch.load",
+        side_effect=[torch.tensor([1.0, 2.0]), torch.tensor([3.0, 4.0])],
+    ), patch("torch.save") as mock_save, patch(
+        "os.path.exists", return_value=True
+    ):
         # Test combining two voices
         result = await tts_service.combine_voices(["voice1", "voice2"])
 
         assert result == "voice1_voice2"
+        assert torch.equal(mock_save.call_args.args[0], torch.tensor([2.0, 3.0]))
 
 
 @pytest.mark.asyncio
@@ -258,3 +287,216 @@ def test_voicepack_loading_error(mock_get_instance, mock_get_voice_path):
     service = TTSService()
     with pytest.raises(ValueError, match="Voice not found: nonexistent_voice"):
         service._generate_audio("test", "nonexistent_voice", 1.0)
+
+
+def test_pad_batch(tts_service):
+    """Test right-padding token lists into a batch tensor and mask"""
+    tokens, mask = tts_service._pad_batch([[1, 2, 3], [4]])
+    assert tokens.tolist() == [[1, 2, 3], [4, 0, 0]]
+    assert mask.tolist() == [[True, True, True], [True, False, False]]
+
+
+def test_load_voice_cached(tts_service):
+    """Test voices are loaded from disk once and then served from cache"""
+    TTSService._voice_cache.clear()
+    with patch("torch.load", return_value=torch.zeros((10, 1, 256))) as mock_load:
+        first = tts_service._load_voice("/mock/voices/af.pt")
+        second = tts_service._load_voice("/mock/voices/af.pt")
+
+    assert mock_load.call_count == 1
+    assert first is not second
+    assert first.data_ptr() == second.data_ptr()
+    TTSService._voice_cache.clear()
+
+
+def test_get_voice_path_uses_index(tts_service, tmp_path, monkeypatch):
+    """Test voice paths come from the index without touching the filesystem"""
+    (tmp_path / "voice1.pt").write_bytes(b"")
+    monkeypatch.setattr(TTSModel, "VOICES_DIR", str(tmp_path))
+    assert TTSService.refresh_voices() == ["voice1"]
+
+    with patch("os.path.exists") as mock_exists:
+        assert tts_service._get_voice_path("voice1") == str(tmp_path / "voice1.pt")
+        mock_exists.assert_not_called()
+
+    assert tts_service._get_voice_path("missing") is None
+    TTSService._voice_index = None
+
+
+def test_load_deleted_voice_drops_index_entry(tts_service, tmp_path, monkeypatch):
+    """Test a voice deleted after indexing is reported as not found"""
+    (tmp_path / "voice1.pt").write_bytes(b"")
+    monkeypatch.setattr(TTSModel, "VOICES_DIR", str(tmp_path))
+    TTSService.refresh_voices()
+    voice_path = tts_service._get_voice_path("voice1")
+    os.remove(voice_path)
+
+    with pytest.raises(ValueError, match="Voice not found: voice1"):
+        tts_service._load_voice(voice_path)
+
+    assert "voice1" not in TTSService._voice_index
+    assert tts_service._get_voice_path("voice1") is None
+    TTSService._voice_index = None
+
+
+def test_cleanup_due_every_n_generations(tts_service, monkeypatch):
+    """Test cached memory is released periodically, not on every generation"""
+    monkeypatch.setattr(settings, "cleanup_every_n", 3)
+    monkeypatch.setattr(TTSService, "_gen_count", 0)
+    due = [tts_service._count_generation() for _ in range(7)]
+
+    assert due == [False, False, True, False, False, True, False]
+
+
+def test_validation_error_skips_cleanup(tts_service, pipeline_model):
+    """Test requests rejected before generation do not release GPU memory"""
+    TTSService._get_voice_path.return_value = None
+    with pytest.raises(ValueError, match="Voice not found"):
+        tts_service._generate_audio("text", "missing", 1.0)
+
+    pipeline_model.cleanup.assert_not_called()
+
+
+def test_stitched_generation_batches_by_length(tts_service, pipeline_model, monkeypatch):
+    """Test stitched chunks are batched by token count and joined in text order"""
+    monkeypatch.setattr(settings, "max_batch_size", 2)
+    chunks = [("a", [1] * 5), ("b", [2]), ("c", [3] * 4), ("d", [4] * 2)]
+    batches = []
+
+    def generate_batch(tokens, mask, voicepack, speed):
+        batches.append(tokens[:, 0].tolist())
+        return [np.full(2, row[0].item() / 10) for row in tokens]
+
+    pipeline_model.generate_from_tokens_batch.side_effect = generate_batch
+    with patch(
+        "api.src.services.tts_service.chunker.split_text_tokens",
+        return_value=iter(chunks),
+    ):
+        audio, _ = tts_service._generate_audio("text", "af", 1.0)
+
+    assert batches == [[2, 4], [3, 1]]
+    expected = np.concatenate(
+        [AudioNormalizer.to_int16(np.full(2, k / 10)) for k in (1, 2, 3, 4)]
+    )
+    np.testing.assert_array_equal(audio, expected)
+
+
+def test_generate_bucket_falls_back_per_chunk(tts_service, pipeline_model):
+    """Test a failed batch is retried per chunk, keeping successful chunks"""
+    pipeline_model.generate_from_tokens_batch.side_effect = RuntimeError("batch")
+    pipeline_model.generate_from_tokens.side_effect = [
+        np.ones(2),
+        RuntimeError("chunk"),
+    ]
+    chunks_data = [("a", [1, 2]), ("b", [3])]
+
+    result = tts_service._generate_bucket([0, 1], chunks_data, torch.zeros(1), 1.0)
+
+    assert len(result) == 2
+    np.testing.assert_array_equal(result[0], np.ones(2))
+    assert result[1] is None
+    assert pipeline_model.generate_from_tokens.call_args_list[0].args[0] == [1, 2]
+
+
+def test_tokenize_chunks_ends_queue_on_error(tts_service, pipeline_model):
+    """Test the tokenizer thread always terminates its queue"""
+    chunk_queue = queue.Queue()
+    with patch(
+        "api.src.services.tts_service.chunker.split_text_tokens",
+        side_effect=RuntimeError("phonemizer"),
+    ):
+        tts_service._tokenize_chunks("text", "a", chunk_queue, threading.Event())
+
+    assert chunk_queue.get_nowait() is None
+    assert chunk_queue.empty()
+
+
+def test_tokenize_chunks_stops_on_full_queue(tts_service, pipeline_model):
+    """Test the tokenizer thread exits when the consumer has given up"""
+    chunk_queue = queue.Queue(maxsize=1)
+    stop = threading.Event()
+    stop.set()
+    with patch(
+        "api.src.services.tts_service.chunker.split_text_tokens",
+        return_value=iter([("a", [1]), ("b", [2])]),
+    ):
+        tts_service._tokenize_chunks("text", "a", chunk_queue, stop)
+
+    assert chunk_queue.empty()
+
+
+def test_stitched_generation_error_releases_producer(
+    tts_service, pipeline_model, monkeypatch
+):
+    """Test a failing consumer stops the tokenizer thread instead of leaking it"""
+    monkeypatch.setattr(settings, "max_batch_size", 1)
+    chunks = [(str(i), [i + 1]) for i in range(20)]
+    # A backend returning no rows leaves the window without results
+    pipeline_model.generate_from_tokens_batch.return_value = []
+    threads = []
+    thread_class = threading.Thread
+
+    def record_thread(*args, **kwargs):
+        thread = thread_class(*args, **kwargs)
+        threads.append(thread)
+        return thread
+
+    monkeypatch.setattr(threading, "Thread", record_thread)
+    with patch(
+        "api.src.services.tts_service.chunker.split_text_tokens",
+        return_value=iter(chunks),
+    ):
+        with pytest.raises(KeyError):
+            tts_service._generate_audio("text", "af", 1.0)
+
+    assert len(threads) == 1
+    assert not threads[0].is_alive()
+
+
+@pytest.mark.asyncio
+async def test_produce_tokens_stages_chunks(tts_service, pipeline_model):
+    """Test the streaming producer stages each chunk and ends with None"""
+    chunk_queue = asyncio.Queue()
+    with patch(
+        "api.src.services.tts_service.chunker.split_text_tokens",
+        return_value=iter([("a", [1]), ("b", [2, 3])]),
+    ):
+        await tts_service._produce_tokens("text", "a", chunk_queue)
+
+    assert chunk_queue.get_nowait() == ("a", [1])
+    assert chunk_queue.get_nowait() == ("b", [2, 3])
+    assert chunk_queue.get_nowait() is None
+    assert pipeline_model.stage_tokens.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_skips_failed_chunks(tts_service, pipeline_model):
+    """Test streaming yields in order, skips failed chunks and flags the last"""
+
+    def generate(tokens, voicepack, speed):
+        if tokens == [2]:
+            raise RuntimeError("chunk")
+        return np.full(4, tokens[0] / 10)
+
+    pipeline_model.generate_from_tokens.side_effect = generate
+    with patch(
+        "api.src.services.tts_service.chunker.split_text_tokens",
+        return_value=iter([("a", [1]), ("b", [2]), ("c", [3])]),
+    ), patch(
+        "api.src.services.tts_service.AudioService.convert_audio",
+        side_effect=lambda audio, *args, **kwargs: audio.tobytes(),
+    ) as mock_convert:
+        output = [
+            chunk async for chunk in tts_service.generate_audio_stream("text", "af", 1.0)
+        ]
+
+    assert output == [
+        AudioNormalizer.to_int16(np.full(4, 0.1)).tobytes(),
+        AudioNormalizer.to_int16(np.full(4, 0.3)).tobytes(),
+    ]
+    flags = [
+        (c.kwargs["is_first_chunk"], c.kwargs["is_last_chunk"])
+        for c in mock_convert.call_args_list
+    ]
+    assert flags == [(True, False), (False, True)]
+    pipeline_model.cleanup.assert_called_once()